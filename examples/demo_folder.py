@@ -8,13 +8,14 @@ import imseqvis
 imseqvis.show("path/to/folder")
 ```
 """
-from imseqvis.sequence_viewer import SequenceViewer, ImageFolder
 import sys
 from pathlib import Path
-from qtpy.QtWidgets import QApplication
 
 
 if __name__ == "__main__":
+    from imseqvis.sequence_viewer import SequenceViewer, ImageFolder
+    from qtpy.QtWidgets import QApplication
+
     FOLDER = Path(__file__).parent
 
     # The image data source
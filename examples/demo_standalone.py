@@ -2,12 +2,9 @@
 This demo shows how to instantiate the SequenceViewer, create an
 application and use some of its signals.
 """
-from imseqvis.sequence_viewer import SequenceViewer
 import numpy as np
 import sys
 
-from qtpy.QtWidgets import QApplication
-
 
 class DummySequence(object):
     """
@@ -17,6 +14,20 @@ class DummySequence(object):
     def __init__(self, num_images: int = 100, channel: int = 2):
         self.num_images = num_images
         self.channel = channel
+        # There are only 6 distinct colors, so we prepare these frames once
+        # instead of allocating a new image upon each request.
+        colors = []
+        for step in range(6):
+            # Broadcast a single pixel instead of a strided channel write.
+            pixel = np.zeros(3, dtype=np.uint8)
+            pixel[self.channel] = min(255, step * 51)
+            img = np.broadcast_to(pixel, (400, 600, 3)).copy()
+            # Shared frames must not be modified by the caller.
+            img.setflags(write=False)
+            colors.append(img)
+        # The color gradually changes back and forth within 10 frames.
+        self._frames = [colors[step if step <= 5 else 10 - step]
+                        for step in range(10)]
     
     def __len__(self) -> int:
         """Required. An image sequence must provide its length."""
@@ -24,13 +35,7 @@ class DummySequence(object):
     
     def __getitem__(self, index: int) -> np.array:
         """Required. An image sequence must provide random access."""
-        img = np.zeros((400, 600, 3), dtype=np.uint8)
-        # Gradually change the color of the image
-        step = index % 10
-        if step > 5:
-            step = 10 - step
-        img[:, :, self.channel] = min(255, step * 51)
-        return img
+        return self._frames[index % 10]
 
     def nextSequence(self):
         """Dummy implementation to navigate between different sequences."""
@@ -46,6 +51,10 @@ class DummySequence(object):
 
 
 if __name__ == "__main__":
+    # Qt is only needed to run the demo, not to import the DummySequence.
+    from imseqvis.sequence_viewer import SequenceViewer
+    from qtpy.QtWidgets import QApplication
+
     SHOW_SEQUENCE_BUTTONS = True
     SHOW_ZOOM_BUTTONS = True
     PLAYBACK_TIMEOUT = 150
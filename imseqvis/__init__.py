@@ -26,7 +26,11 @@ def show_sequence(
     import sys
     from .sequence_viewer import SequenceViewer
 
-    app = QApplication(sys.argv)
+    # Reuse the application if one exists already, e.g. when called
+    # repeatedly from an interactive session.
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
     viewer = SequenceViewer(image_sequence=image_sequence, **kwargs)
 
     # Add keyboard shortcuts for zooming.
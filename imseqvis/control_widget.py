@@ -1,7 +1,17 @@
+from functools import partial
 from qtpy.QtWidgets import (
     QWidget, QHBoxLayout, QSlider, QLineEdit, QLabel, QToolButton)
-from qtpy.QtCore import Qt, Signal, Slot, QTimer
-from qtpy.QtGui import QIcon, QFontMetrics
+from qtpy.QtCore import Qt, Signal, Slot, QTimer, QEvent, QElapsedTimer
+from qtpy.QtGui import QIcon, QFontMetrics, QIntValidator
+
+
+def _keyCode(key) -> int:
+    """
+    Returns the integer code of a Qt key. Qt5/6 compatibility - Qt6 enums
+    can't be used as dictionary keys for the int-valued QKeyEvent.key(), and
+    Qt5 doesn't provide the ".value" attribute.
+    """
+    return int(getattr(key, 'value', key))
 
 
 class SequenceControlWidget(QWidget):
@@ -16,7 +26,8 @@ class SequenceControlWidget(QWidget):
     """
 
     # Signaled whenever the selected frame (i.e. slider value) changes. Note
-    # that this index is 1-based.
+    # that this index is 1-based. Rapid changes, e.g. while dragging the
+    # slider, are coalesced into a single signal.
     indexChanged = Signal(int)
 
     # The user wants to display the image at its original size.
@@ -48,7 +59,10 @@ class SequenceControlWidget(QWidget):
           playback_timeout: Timeout of the playback timer in milliseconds.
           playback_wait_for_viewer_ready: If True, the timer playback will
             only advance to the next index if `onViewerReady` has been
-            called since the last emitted `indexChanged` signal.
+            called since the last emitted `indexChanged` signal. The next
+            index will then be emitted `playback_timeout` ms after the
+            previous one, or as soon as the viewer is ready if it took
+            longer than that.
           include_sequence_navigation_buttons: If True, controls to skip to the
             previous or next sequence will be shown. If clicked, the
             corresponding `previousSequenceRequest` or `nextSequenceRequest`
@@ -59,25 +73,75 @@ class SequenceControlWidget(QWidget):
         super().__init__()
         self.max_value = max_value
         self.playback_timeout = playback_timeout
-
+        # Width of a single digit, used to size the frame number label.
+        self._digit_width = QFontMetrics(self.font()).horizontalAdvance('0')
+
+        # The playback timer is a single-shot timer. If we wait for the
+        # viewer, it is re-armed once the viewer reports that the requested
+        # frame is shown (see `onViewerReady`), otherwise right after the
+        # next frame has been requested. The playback clock measures the time
+        # since the last frame request to keep the desired frame rate.
         self.playback_timer = QTimer()
+        self.playback_timer.setTimerType(Qt.PreciseTimer)
+        self.playback_timer.setSingleShot(True)
         self.playback_timer.timeout.connect(self.onPlaybackTimeout)
+        self.playback_clock = QElapsedTimer()
         self.playback_wait_for_viewer_ready = playback_wait_for_viewer_ready
         self.is_viewer_ready = True
+        self.is_playing = False
+        # The most recently emitted index, to skip redundant notifications.
+        self._last_value = 0
+
+        # Index changes are signaled once control returns to the event loop.
+        # Thus, rapid changes (e.g. while dragging the slider) are coalesced
+        # and only the latest index will be signaled.
+        self.index_timer = QTimer()
+        self.index_timer.setSingleShot(True)
+        self.index_timer.setInterval(0)
+        self.index_timer.timeout.connect(self.emitIndexChanged)
 
         self.initUI(include_sequence_navigation_buttons, include_zoom_buttons)
+        # Setting up the slider selects the first index. Nobody can be
+        # connected to `indexChanged` yet, so there's nothing to signal (the
+        # owner shows the first image explicitly).
+        self.index_timer.stop()
 
     @Slot(int)
     def setMaxValue(self, max_value):
+        """
+        Sets the number of frames and resets the slider to the first frame.
+
+        This reset is not signaled via `indexChanged`, i.e. the caller is
+        responsible for showing the first frame.
+        """
         self.max_value = max_value
         self.slider.setRange(1, self.max_value)
-        self.label_current_value.setFixedWidth(
-            QFontMetrics(self.font()).width(str(self.max_value)) + 10)
+        self.manual_input.validator().setTop(self.max_value)
+        self.label_current_value.setFixedWidth(self.labelWidth())
         self.updateSlider(1)
+        # The deferred signal would arrive after the caller already showed
+        # the first frame.
+        self.index_timer.stop()
+
+    def labelWidth(self) -> int:
+        """Returns the width needed to display the maximum frame number."""
+        # Add minor padding to the label.
+        return self._digit_width * len(str(self.max_value)) + 10
+
+    def changeEvent(self, event):
+        """Updates the cached font metrics if the font changes."""
+        if event.type() == QEvent.FontChange:
+            self._digit_width = QFontMetrics(self.font()).horizontalAdvance('0')
+            self.label_current_value.setFixedWidth(self.labelWidth())
+        super().changeEvent(event)
 
     @Slot()
     def onViewerReady(self):
         self.is_viewer_ready = True
+        if self.is_playing and self.playback_wait_for_viewer_ready:
+            # Schedule the next frame, respecting the playback timeout.
+            remaining = self.playback_timeout - self.playback_clock.elapsed()
+            self.playback_timer.start(max(0, remaining))
 
     def currentIndex(self) -> int:
         return self.slider.value()
@@ -89,9 +153,21 @@ class SequenceControlWidget(QWidget):
         # List of theme icon names:
         # https://standards.freedesktop.org/icon-naming-spec/icon-naming-spec-latest.html
 
-        # Automatic playback button (toggles between play/pause).
+        # Automatic playback button (toggles between play/pause). The button
+        # is checkable, so its icon switches with the checked state and we
+        # don't need to replace the icon upon each toggle.
+        icon_play = QIcon.fromTheme('media-playback-start')
+        icon_pause = QIcon.fromTheme('media-playback-pause')
+        icon_playback = QIcon()
+        for size in icon_play.availableSizes():
+            icon_playback.addPixmap(
+                icon_play.pixmap(size), QIcon.Normal, QIcon.Off)
+        for size in icon_pause.availableSizes():
+            icon_playback.addPixmap(
+                icon_pause.pixmap(size), QIcon.Normal, QIcon.On)
         self.button_playback = QToolButton()
-        self.button_playback.setIcon(QIcon.fromTheme('media-playback-start'))
+        self.button_playback.setCheckable(True)
+        self.button_playback.setIcon(icon_playback)
         self.button_playback.setToolTip('Toggle play/pause')
         self.button_playback.clicked.connect(self.togglePlayback)
 
@@ -105,14 +181,12 @@ class SequenceControlWidget(QWidget):
         self.button_previous_frame = QToolButton()
         self.button_previous_frame.setIcon(QIcon.fromTheme('go-previous'))
         self.button_previous_frame.setToolTip('Previous frame')
-        self.button_previous_frame.clicked.connect(
-            lambda: self.skip(self.button_previous_frame, -1))
+        self.button_previous_frame.clicked.connect(self.skipPrevious)
 
         self.button_next_frame = QToolButton()
         self.button_next_frame.setIcon(QIcon.fromTheme('go-next'))
         self.button_next_frame.setToolTip('Next frame')
-        self.button_next_frame.clicked.connect(
-            lambda: self.skip(self.button_next_frame, +1))
+        self.button_next_frame.clicked.connect(self.skipNext)
 
         # Navigation buttons (skip to previous/next sequence).
         button_previous_sequence = QToolButton()
@@ -129,21 +203,19 @@ class SequenceControlWidget(QWidget):
         self.slider = QSlider(Qt.Horizontal)
         self.slider.setRange(1, self.max_value)
         self.slider.setMinimumWidth(100)
-        self.slider.valueChanged.connect(
-            lambda value: self.sliderValueChanged(value))
+        self.slider.valueChanged.connect(self.sliderValueChanged)
 
         # Text box to manually set the slider value.
         self.manual_input = QLineEdit()
         self.manual_input.setFixedWidth(100)
         self.manual_input.setPlaceholderText('Jump to:')
         self.manual_input.setToolTip('Enter frame to jump to')
+        self.manual_input.setValidator(QIntValidator(1, self.max_value, self))
         self.manual_input.returnPressed.connect(self.updateSliderFromTextBox)
 
         # Label to display the current value.
-        max_label_width = QFontMetrics(self.font()).width(str(self.max_value))
         self.label_current_value = QLabel('')
-        # Add minor padding to the label.
-        self.label_current_value.setFixedWidth(max_label_width + 10)
+        self.label_current_value.setFixedWidth(self.labelWidth())
         self.label_current_value.setAlignment(
             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
 
@@ -188,6 +260,19 @@ class SequenceControlWidget(QWidget):
             layout.addWidget(button_zoom_original)
 
         self.setLayout(layout)
+
+        # Keyboard shortcuts, see `keyPressEvent`.
+        self._key_actions = {
+            _keyCode(Qt.Key_Escape): self.resetSlider,
+            _keyCode(Qt.Key_R): self.resetSlider,
+            _keyCode(Qt.Key_P): self.togglePlayback,
+            _keyCode(Qt.Key_X): self.togglePlayback,
+            _keyCode(Qt.Key_B): self.skipPrevious,
+            _keyCode(Qt.Key_V): partial(self.skip, self.button_previous_frame, -10),
+            _keyCode(Qt.Key_N): self.skipNext,
+            _keyCode(Qt.Key_M): partial(self.skip, self.button_next_frame, +10),
+        }
+
         # Emit signal & update labels.
         self.sliderValueChanged(1)
 
@@ -202,26 +287,31 @@ class SequenceControlWidget(QWidget):
         # * Left/Right/PageUp/PageDown - these are handled by the slider and
         #   overriding them here would be confusing for the user (e.g.
         #   inconsistent step sizes).
-        if event.key() in [Qt.Key_Escape, Qt.Key_R]:
-            self.resetSlider()
-        elif event.key() in [Qt.Key_P, Qt.Key_X]:
-            self.togglePlayback()
-        elif event.key() == Qt.Key_B:
-            self.skip(self.button_previous_frame, -1)
-        elif event.key() == Qt.Key_V:
-            self.skip(self.button_previous_frame, -10)
-        elif event.key() == Qt.Key_N:
-            self.skip(self.button_next_frame, +1)
-        elif event.key() == Qt.Key_M:
-            self.skip(self.button_next_frame, +10)
+        action = self._key_actions.get(_keyCode(event.key()))
+        if action is None:
+            # Ignores the event, so it is passed on to the parent widget.
+            super().keyPressEvent(event)
+        else:
+            action()
+            event.accept()
 
+    @Slot(int)
     def sliderValueChanged(self, value):
+        if value == self._last_value:
+            return
+        self._last_value = value
         self.is_viewer_ready = False
         self.button_previous_frame.setEnabled(value > 1)
         self.button_next_frame.setEnabled(value < self.max_value)
         self.label_current_value.setText(str(value))
-        self.indexChanged.emit(value)
+        if not self.index_timer.isActive():
+            self.index_timer.start()
 
+    @Slot()
+    def emitIndexChanged(self):
+        self.indexChanged.emit(self._last_value)
+
+    @Slot()
     def resetSlider(self):
         self.stopPlayback()
         self.updateSlider(1)
@@ -233,48 +323,74 @@ class SequenceControlWidget(QWidget):
         # A manual fwd/bwd request always stops the playback.
         self.stopPlayback()
 
+    @Slot()
+    def skipPrevious(self):
+        """Steps to the previous frame."""
+        self.skip(self.button_previous_frame, -1)
+
+    @Slot()
+    def skipNext(self):
+        """Steps to the next frame."""
+        self.skip(self.button_next_frame, +1)
+
+    @Slot()
     def stopPlayback(self):
+        self.is_playing = False
         self.playback_timer.stop()
-        self.button_playback.setIcon(QIcon.fromTheme('media-playback-start'))
+        self.button_playback.setChecked(False)
 
+    @Slot()
     def startPlayback(self):
         if self.slider.value() >= self.max_value:
             # Restart playback from the beginning.
             self.updateSlider(1)
+        self.is_playing = True
+        self.playback_clock.start()
         self.playback_timer.start(self.playback_timeout)
-        self.button_playback.setIcon(QIcon.fromTheme('media-playback-pause'))
+        self.button_playback.setChecked(True)
 
+    @Slot()
     def togglePlayback(self):
-        if self.playback_timer.isActive():
+        if self.is_playing:
             self.stopPlayback()
         else:
             self.startPlayback()
 
+    @Slot()
     def onPlaybackTimeout(self):
         if self.playback_wait_for_viewer_ready and not self.is_viewer_ready:
-            # Skip this timeout if the viewer has not shown the last image yet.
+            # The viewer has not shown the last image yet. The timer will be
+            # restarted by `onViewerReady`.
             return
         value = self.slider.value() + 1
         if value <= self.max_value:
+            self.playback_clock.start()
             self.updateSlider(value)
+            if not self.playback_wait_for_viewer_ready:
+                self.playback_timer.start(self.playback_timeout)
         else:
             self.stopPlayback()
 
     def updateSlider(self, value):
-        # Update the slider and label with the new value.
-        if 1 <= value <= self.max_value:
+        # Update the slider with the new value. The label will be updated by
+        # `sliderValueChanged`.
+        if (1 <= value <= self.max_value) and (value != self.slider.value()):
             self.slider.setValue(value)
-            self.label_current_value.setText(str(value))
 
+    @Slot()
     def updateSliderFromTextBox(self):
-        # Get the value from the text box.
-        try:
-            value = int(self.manual_input.text())
-            self.stopPlayback()
-            self.updateSlider(value)
-        except ValueError:
-            pass
-        # Always reset the input text box.
+        # The validator ensures that the text box only emits `returnPressed`
+        # for a frame number within the valid range. This number may contain
+        # group separators (e.g. "1,500"), so it must be parsed via the
+        # validator's locale.
+        value, ok = self.manual_input.validator().locale().toInt(
+            self.manual_input.text())
+        if not ok:
+            return
+        self.stopPlayback()
+        self.updateSlider(value)
+        # Reset the input text box after jumping to the frame. Out-of-range
+        # input is kept, so the user can correct it.
         self.manual_input.setText('')
     
     @Slot()
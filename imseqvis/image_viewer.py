@@ -1,42 +1,91 @@
 import numpy as np
-import qimage2ndarray
+from functools import partial
 from pathlib import Path
 
-from qtpy.QtWidgets import QWidget, QScrollArea, QApplication
-from qtpy.QtCore import Qt, QPointF, Signal, Slot, QRect, QMimeData
+from qtpy.QtWidgets import QWidget, QScrollArea
+from qtpy.QtCore import Qt, QPointF, Signal, Slot, QMimeData, QTimer, QEvent
 from qtpy.QtGui import (
     QPixmap, QImage, QFont, QPainter, QPen, QColor, QBrush, QPalette,
     QMouseEvent, QCursor)
 
 
-def pixmapFromNumpy(img_np: np.array) -> QPixmap:
+# QImage formats which share the memory layout of a uint8 NumPy image with the
+# given number of channels.
+_QIMAGE_FORMATS = {
+    1: QImage.Format_Grayscale8,
+    3: QImage.Format_RGB888,
+    4: QImage.Format_RGBA8888
+}
+
+
+def _qimageFromUint8(img_np: np.array) -> QImage:
     """
-    Converts the given NumPy array image into a QPixmap.
+    Wraps the given uint8 (1, 3, or 4-channel) image into a QImage without
+    copying the pixel data (unless the image is not C-contiguous).
 
-    Args:
-      img_np: The (1, 3, or 4-channel) image. This parameter must not be None.
+    The returned QImage keeps a reference to the underlying buffer.
+    """
+    img_np = np.ascontiguousarray(img_np)
+    channels = 1 if (img_np.ndim < 3) else img_np.shape[2]
+    qimage = QImage(
+        img_np.data, img_np.shape[1], img_np.shape[0], img_np.strides[0],
+        _QIMAGE_FORMATS[channels])
+    # The QImage doesn't own the data, so we must keep the array alive.
+    qimage._buffer = img_np
+    return qimage
+
+
+# Error pixmaps for unsupported images, see `_errorPixmap`.
+_error_pixmaps = dict()
+
+
+def _errorPixmap(shape: tuple) -> QPixmap:
     """
-    if (img_np.ndim < 3) or img_np.shape[2] in [1, 3, 4]:
-        qimage = qimage2ndarray.array2qimage(img_np.copy())
-    else:
-        img_width = max(400, min(img_np.shape[1], 1200))
-        img_height = max(200, min(img_np.shape[0], 1200))
+    Returns a pixmap which informs the user that an image of the given shape
+    cannot be displayed.
+
+    Error pixmaps are cached, as unsupported images usually affect all
+    frames of a sequence.
+    """
+    img_width = max(400, min(shape[1], 1200))
+    img_height = max(200, min(shape[0], 1200))
+    key = (img_width, img_height, shape[2])
+    if key not in _error_pixmaps:
         qimage = QImage(img_width, img_height, QImage.Format_RGB888)
         qimage.fill(Qt.white)
         qp = QPainter()
         qp.begin(qimage)
-        qp.setRenderHint(QPainter.HighQualityAntialiasing)
+        qp.setRenderHint(QPainter.Antialiasing)
         qp.setPen(QPen(QColor(200, 0, 0)))
-        font = QFont()
+        font = QFont('Helvetica')
         font.setPointSize(20)
         font.setBold(True)
-        font.setFamily('Helvetica')
         qp.setFont(font)
         qp.drawText(
             qimage.rect(),
             Qt.AlignCenter,
-            f"Error!\nCannot display a\n{img_np.shape[2]}-channel image.")
+            f"Error!\nCannot display a\n{shape[2]}-channel image.")
         qp.end()
+        _error_pixmaps[key] = QPixmap.fromImage(qimage)
+    # Return a (shallow) copy, so the cached pixmap stays untouched if the
+    # caller paints onto it.
+    return QPixmap(_error_pixmaps[key])
+
+
+def pixmapFromNumpy(img_np: np.array) -> QPixmap:
+    """
+    Converts the given NumPy array image into a QPixmap.
+
+    Args:
+      img_np: The (1, 3, or 4-channel) image. This parameter must not be None.
+    """
+    if (img_np.ndim == 3) and (img_np.shape[2] not in _QIMAGE_FORMATS):
+        return _errorPixmap(img_np.shape)
+    if img_np.dtype != np.uint8:
+        # Values outside [0, 255] are clipped, i.e. images are not
+        # normalized.
+        img_np = img_np.clip(0, 255).astype(np.uint8)
+    qimage = _qimageFromUint8(img_np)
     if qimage.isNull():
         raise ValueError(
             'Invalid Numpy image received, cannot convert it to QImage')
@@ -49,8 +98,11 @@ def isMimeDataLocalPath(mime_data: QMimeData) -> bool:
     be dropped onto the ImageViewer/Canvas.
     """
     if mime_data.hasUrls():
-        local = [Path(url.toLocalFile()).exists() for url in mime_data.urls()]
-        return any(local)
+        # Checking the scheme first avoids probing the file system for
+        # non-local URLs. Stop at the first existing path.
+        return any(
+            url.isLocalFile() and Path(url.toLocalFile()).exists()
+            for url in mime_data.urls())
     return False
 
 
@@ -108,7 +160,27 @@ class ImageCanvas(QWidget):
         super().__init__(parent)
         self._scale = 1.0
         self._pixmap = QPixmap()
+        # The pixmap may be a subsampled version of the image, see
+        # `showPixmap`. Thus, the pixmap is drawn at the display scale, i.e.
+        # the image scale multiplied by the subsampling stride.
+        self._pixmap_stride = 1
+        self._display_scale = 1.0
+        # Downscaled copy of the pixmap, see `scaledPixmap`.
+        self._scaled_pixmap = None
+        self._scaled_pixmap_key = None
+        self._transformation_mode = Qt.FastTransformation
+        # While the user zooms or pans, an upscaled image is drawn via nearest
+        # neighbor interpolation, see `renderTransformationMode`.
+        self._is_interacting = False
+        self._interaction_timer = QTimer()
+        self._interaction_timer.setSingleShot(True)
+        self._interaction_timer.setInterval(150)
+        self._interaction_timer.timeout.connect(self._finishInteraction)
         self._painter = QPainter()
+        # Cached result of `offsetToCenter`.
+        self._offset_to_center = None
+        # Brush to fill the background, updated upon palette changes.
+        self._background_brush = QBrush(self.palette().color(QPalette.Window))
         # Indicates whether the user is currently dragging the image.
         self._is_dragging = False
         # Previous dragging position, relative to the parent widget, i.e. the
@@ -116,31 +188,116 @@ class ImageCanvas(QWidget):
         self._prev_drag_pos = None
         self.setMouseTracking(True)
         self.setAcceptDrops(True)
+        # The canvas paints its full area itself, so Qt can skip erasing the
+        # background before each paint event.
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
 
     def setScale(self, scale: float) -> None:
         """Sets the scale factor of the displayed image."""
         prev_scale = self._scale
         self._scale = scale
+        self._display_scale = self._scale * self._pixmap_stride
+        self._offset_to_center = None
         self.adjustSize()
         self.update()
         if prev_scale != self._scale:
             self.imageScaleChanged.emit(self._scale)
 
-    def showPixmap(self, pixmap: QPixmap) -> None:
-        """Displays the given pixmap."""
+    def scale(self) -> float:
+        """Returns the scale factor of the displayed image."""
+        return self._scale
+
+    def showPixmap(self, pixmap: QPixmap, stride: int = 1) -> None:
+        """
+        Displays the given pixmap.
+
+        Args:
+          pixmap: The pixmap to be displayed.
+          stride: If the pixmap has been subsampled from a larger image (to
+            speed up displaying it at a small scale), this is the subsampling
+            step, i.e. each pixmap pixel corresponds to stride x stride image
+            pixels. Scale and pixel positions always refer to the image.
+        """
         self._pixmap = pixmap
-        self.repaint()
+        self._pixmap_stride = stride
+        self._display_scale = self._scale * self._pixmap_stride
+        self._offset_to_center = None
+        self._scaled_pixmap_key = None
+        self.update()
 
     def pixmap(self) -> QPixmap:
         """Returns the currently displayed pixmap."""
         return self._pixmap
 
+    def pixmapStride(self) -> int:
+        """Returns the subsampling step of the displayed pixmap."""
+        return self._pixmap_stride
+
+    def scaledPixmap(self) -> QPixmap:
+        """
+        Returns the currently displayed pixmap resized to the current scale.
+
+        The resized pixmap is cached until either the pixmap, the scale, or
+        the transformation mode changes.
+        """
+        key = (
+            self._pixmap.cacheKey(), self._display_scale,
+            self._transformation_mode)
+        if key != self._scaled_pixmap_key:
+            self._scaled_pixmap = self._pixmap.scaled(
+                self._pixmap.size() * self._display_scale,
+                Qt.IgnoreAspectRatio, self._transformation_mode)
+            self._scaled_pixmap_key = key
+        return self._scaled_pixmap
+
+    def setTransformationMode(self, mode: Qt.TransformationMode) -> None:
+        """
+        Sets the interpolation used to scale the displayed image, i.e.
+        `Qt.FastTransformation` (nearest neighbor, default) or
+        `Qt.SmoothTransformation` (bilinear).
+        """
+        self._transformation_mode = mode
+        self.update()
+
+    def transformationMode(self) -> Qt.TransformationMode:
+        """Returns the interpolation used to scale the displayed image."""
+        return self._transformation_mode
+
+    def renderTransformationMode(self) -> Qt.TransformationMode:
+        """
+        Returns the interpolation which is currently used to render an
+        upscaled image. This is `Qt.FastTransformation` while the user zooms
+        or pans, to keep the interaction responsive, and the configured
+        `transformationMode` otherwise.
+
+        Downscaled images are always rendered from the cached scaled pixmap
+        (see `scaledPixmap`), which uses the configured mode, as panning
+        then only needs to copy the cached pixmap.
+        """
+        if self._is_interacting:
+            return Qt.FastTransformation
+        return self._transformation_mode
+
+    def _startInteraction(self) -> None:
+        """Marks the start (or continuation) of a zoom or pan gesture."""
+        self._is_interacting = True
+        self._interaction_timer.start()
+
+    @Slot()
+    def _finishInteraction(self) -> None:
+        """Renders the image with the configured interpolation again."""
+        self._is_interacting = False
+        if (self._transformation_mode != Qt.FastTransformation) \
+                and (self._display_scale > 1.0):
+            self.update()
+
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         """Event handle for mouse move events."""
         pos = self.transformPos(event.pos())
         if Qt.RightButton & event.buttons():
             # Skip mouse move signals while panning the image.
             self._is_dragging = True
+            self._startInteraction()
             self.drag(event.pos())
         else:
             self.mouseMoved.emit(pos)
@@ -174,7 +331,7 @@ class ImageCanvas(QWidget):
         if event.button() == Qt.RightButton:
             # Viewer can be panned via the right button.
             self._prev_drag_pos = self.mapToParent(event.pos())
-            QApplication.setOverrideCursor(Qt.ClosedHandCursor)
+            self.setCursor(Qt.ClosedHandCursor)
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """Event handler for mouse release events."""
@@ -186,12 +343,13 @@ class ImageCanvas(QWidget):
                 self.mouseClickedMiddle.emit(pos)
             elif event.button() == Qt.RightButton:
                 self.mouseClickedRight.emit(pos)
-        if event.button() == Qt.LeftButton:
-            QApplication.restoreOverrideCursor()
+        if event.button() == Qt.RightButton:
+            self.unsetCursor()
         self._is_dragging = False
 
     def wheelEvent(self, event):
         """Event handler for mouse wheel events."""
+        self._startInteraction()
         delta = event.angleDelta()
         dx, dy = delta.x(), delta.y()
         modifiers = event.modifiers()
@@ -221,33 +379,65 @@ class ImageCanvas(QWidget):
             fpath = getLocalPathFromMimeData(event.mimeData())
             self.pathDropped.emit(fpath)
 
+    def changeEvent(self, event):
+        """Updates the cached background brush if the palette changes."""
+        if event.type() == QEvent.PaletteChange:
+            self._background_brush = QBrush(
+                self.palette().color(QPalette.Window))
+        super().changeEvent(event)
+
+    def resizeEvent(self, event):
+        """Event handler for resize events."""
+        self._offset_to_center = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         """Renders the image onto the visible canvas."""
-        if not self._pixmap:
-            return super(ImageCanvas, self).paintEvent(event)
         qp = self._painter
         qp.begin(self)
-        qp.setRenderHint(QPainter.Antialiasing)
-        qp.fillRect(self.rect(), QBrush(self.palette().color(QPalette.Window)))
-        qp.scale(self._scale, self._scale)
+        # Only the exposed region needs to be cleared.
+        if not self._pixmap:
+            qp.fillRect(event.rect(), self._background_brush)
+            qp.end()
+            return
+        # If the image doesn't need to be centered, it covers the whole
+        # canvas and we can skip clearing the background.
+        if not self.offsetToCenter().isNull():
+            qp.fillRect(event.rect(), self._background_brush)
+        if self._display_scale < 1.0:
+            # A downscaled image is cached at its displayed size, so that
+            # repainting (e.g. upon focus changes) only needs to copy it.
+            qp.drawPixmap(
+                self.offsetToCenter() * self._display_scale,
+                self.scaledPixmap())
+            qp.end()
+            return
+        # Interpolation is pointless if the pixmap is drawn at its size.
+        qp.setRenderHint(
+            QPainter.SmoothPixmapTransform,
+            (self.renderTransformationMode() == Qt.SmoothTransformation)
+            and (self._display_scale != 1.0))
+        qp.scale(self._display_scale, self._display_scale)
         # Adapted fast drawing from:
         # https://www.qt.io/blog/2006/05/13/fast-transformed-pixmapimage-drawing
         # If the painter has an invertible world transformation matrix, we use
         # it to get the visible rectangle (saves a lot of drawing resources).
         inv_wt, valid = qp.worldTransform().inverted()
+        qp.translate(self.offsetToCenter())
         if valid:
-            qp.translate(self.offsetToCenter())
+            # Only copy the part of the pixmap which is actually visible.
             exposed_rect = inv_wt.mapRect(event.rect()).adjusted(-1, -1, 1, 1)
+            exposed_rect = exposed_rect.intersected(self._pixmap.rect())
             qp.drawPixmap(exposed_rect, self._pixmap, exposed_rect)
         else:
-            qp.translate(self.offsetToCenter())
             qp.drawPixmap(0, 0, self._pixmap)
-            exposed_rect = QRect(0, 0, self._pixmap.width(), self._pixmap.height())
         qp.end()
 
     def transformPos(self, point: QPointF) -> QPointF:
-        """Converts from widget coordinates to painter coordinates."""
-        return QPointF(point.x()/self._scale, point.y()/self._scale) - self.offsetToCenter()
+        """Converts from widget coordinates to image coordinates."""
+        ds = self._display_scale
+        return (QPointF(point.x()/ds, point.y()/ds) - self.offsetToCenter()) \
+            * self._pixmap_stride
 
     def pixelAtWidgetPos(self, widget_pos: QPointF) -> QPointF:
         """Returns the pixel position at the given widget coordinate."""
@@ -255,24 +445,34 @@ class ImageCanvas(QWidget):
 
     def pixelToWidgetPos(self, pixel_pos: QPointF) -> QPointF:
         """Compute the widget position of the given pixel position."""
-        return (pixel_pos + self.offsetToCenter()) * self._scale
+        return (pixel_pos / self._pixmap_stride + self.offsetToCenter()) \
+            * self._display_scale
 
     def offsetToCenter(self) -> QPointF:
-        """Utility to allow transforming widget to pixel coordinates."""
-        area = super().size()
-        aw, ah = area.width(), area.height()
-        w = self._pixmap.width() * self._scale
-        h = self._pixmap.height() * self._scale
-        x = (aw - w) / (2 * self._scale) if aw > w else 0
-        y = (ah - h) / (2 * self._scale) if ah > h else 0
-        return QPointF(x, y)
+        """
+        Utility to allow transforming widget to pixel coordinates. Note that
+        the offset is given in pixmap coordinates.
+
+        The offset is cached until the scale, the pixmap, or the widget size
+        changes, as it is needed for each mouse move.
+        """
+        if self._offset_to_center is None:
+            area = super().size()
+            aw, ah = area.width(), area.height()
+            ds = self._display_scale
+            w = self._pixmap.width() * ds
+            h = self._pixmap.height() * ds
+            x = (aw - w) / (2 * ds) if aw > w else 0
+            y = (ah - h) / (2 * ds) if ah > h else 0
+            self._offset_to_center = QPointF(x, y)
+        return self._offset_to_center
 
     def sizeHint(self):
         return self.minimumSizeHint()
 
     def minimumSizeHint(self):
         if self._pixmap:
-            return self._scale * self._pixmap.size()
+            return self._display_scale * self._pixmap.size()
         return super(ImageCanvas, self).minimumSizeHint()
 
 
@@ -309,17 +509,39 @@ class ImageViewer(QScrollArea):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._img_np = None
+        self._is_pixmap_outdated = False
         self._img_scale = 1.0
         self._min_img_scale = None
         self._canvas = None
+        # Scroll requests are collected and applied once control returns to
+        # the event loop, see `scrollAbsolute`.
+        self._pending_scroll = dict()
+        self._is_applying_scroll = False
+        self._scroll_timer = QTimer()
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(0)
+        self._scroll_timer.timeout.connect(self._applyScroll)
         self._prepareLayout()
 
     def imageNumpy(self) -> np.array:
-        """Returns the shown image as numpy ndarray."""
+        """
+        Returns the shown image as numpy ndarray.
+
+        The returned array is read-only, use `.copy()` if you need a
+        modifiable image. If a writable image was passed to `showImage`, this
+        is a copy of it. If a read-only image was passed, this is a view of
+        it, i.e. changes to its underlying buffer (e.g. via a writable base
+        array or a memory-mapped file) will be visible here, but not on the
+        canvas until the image is shown again.
+        """
         return self._img_np
 
     def imagePixmap(self) -> QPixmap:
         """Returns the shown image as QPixmap."""
+        if self._canvas.pixmapStride() > 1:
+            # The canvas shows a subsampled pixmap at small scales, so we
+            # need to convert the full resolution image.
+            return pixmapFromNumpy(self._img_np)
         return self._canvas.pixmap()
 
     def pixelFromGlobal(self, global_pos):
@@ -351,11 +573,13 @@ class ImageViewer(QScrollArea):
         # a scroll bar or used the keyboard (e.g. arrow keys) to adjust the
         # bar's position.
         self.verticalScrollBar().valueChanged.connect(
-            lambda new_value: self.scrollAbsolute(
-                new_value, ImageCanvas.ORIENTATION_VERTICAL))
+            partial(
+                self.scrollAbsolute,
+                orientation=ImageCanvas.ORIENTATION_VERTICAL))
         self.horizontalScrollBar().valueChanged.connect(
-            lambda new_value: self.scrollAbsolute(
-                new_value, ImageCanvas.ORIENTATION_HORIZONTAL))
+            partial(
+                self.scrollAbsolute,
+                orientation=ImageCanvas.ORIENTATION_HORIZONTAL))
 
     def currentImageScale(self):
         """Returns the currently applied image scale factor."""
@@ -391,22 +615,40 @@ class ImageViewer(QScrollArea):
             return
         steps = -delta / 120
         bar = self._scroll_bars[orientation]
-        value = bar.value() + bar.singleStep() * steps
-        self.scrollAbsolute(value, orientation)
+        # Add to a pending scroll request (if any) of the current burst.
+        value = self._pending_scroll.get(orientation, bar.value())
+        self.scrollAbsolute(value + bar.singleStep() * steps, orientation)
 
     @Slot(int, int)
     def scrollAbsolute(self, value, orientation):
-        """Sets the scrollbar to the given value."""
-        if orientation not in self._scroll_bars:
+        """
+        Sets the scrollbar to the given value.
+
+        Scroll requests are coalesced, i.e. a burst of requests (e.g. from a
+        touchpad or while dragging) will be applied at once when control
+        returns to the event loop, emitting a single `viewChanged` signal.
+        """
+        if (orientation not in self._scroll_bars) or self._is_applying_scroll:
             return
         bar = self._scroll_bars[orientation]
-        # Ensure that value is an integer to prevent TypeError within bar.setValue()
-        value = int(value)
-        if value < bar.minimum():
-            value = bar.minimum()
-        if value > bar.maximum():
-            value = bar.maximum()
-        bar.setValue(value)
+        self._pending_scroll[orientation] = max(
+            bar.minimum(), min(bar.maximum(), value))
+        if not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+
+    @Slot()
+    def _applyScroll(self):
+        """Applies the pending scroll requests."""
+        pending = self._pending_scroll
+        self._pending_scroll = dict()
+        # Setting the values triggers valueChanged, which must not be
+        # treated as a new scroll request.
+        self._is_applying_scroll = True
+        for orientation, value in pending.items():
+            # Ensure that value is an integer to prevent TypeError within
+            # bar.setValue()
+            self._scroll_bars[orientation].setValue(int(value))
+        self._is_applying_scroll = False
         self.viewChanged.emit()
 
     def showImage(self, img: np.array, reset_scale: bool = True) -> None:
@@ -417,9 +659,13 @@ class ImageViewer(QScrollArea):
           img: The image to be displayed.
           reset_scale: If True, the zoom setting of the viewer will be reset.
         """
-        pixmap = pixmapFromNumpy(img)
-        self._img_np = img.copy()
-        self._canvas.showPixmap(pixmap)
+        # Writable images are copied, so the shown image cannot be changed
+        # by the caller afterwards. For read-only images (e.g. frames of the
+        # provided image sequences), a view avoids the copy.
+        self._img_np = img.view() if not img.flags.writeable else img.copy()
+        self._img_np.setflags(write=False)
+        # The pixmap will be created by `paintCanvas`.
+        self._is_pixmap_outdated = True
 
         # Ensure that image has a minimum size of about 32x32 px (unless it is
         # actually smaller).
@@ -437,8 +683,8 @@ class ImageViewer(QScrollArea):
         w1 = self.width() - eps
         h1 = self.height() - eps
         a1 = w1 / h1
-        w2 = float(self._canvas.pixmap().width())
-        h2 = float(self._canvas.pixmap().height())
+        w2 = float(self._img_np.shape[1])
+        h2 = float(self._img_np.shape[0])
         a2 = w2 / h2
         self._img_scale = w1 / w2 if a2 >= a1 else h1 / h2
         self.paintCanvas()
@@ -447,13 +693,51 @@ class ImageViewer(QScrollArea):
         self._img_scale = scale
         self.paintCanvas()
 
+    def setTransformationMode(self, mode: Qt.TransformationMode) -> None:
+        """
+        Sets the interpolation used to scale the image, i.e.
+        `Qt.FastTransformation` (nearest neighbor, default) or
+        `Qt.SmoothTransformation` (bilinear).
+        """
+        self._canvas.setTransformationMode(mode)
+        # The subsampled preview is only used for nearest neighbor scaling.
+        self.paintCanvas()
+
     def scale(self) -> float:
         return self._img_scale
 
+    def _previewStride(self) -> int:
+        """
+        Returns the subsampling step for the displayed pixmap.
+
+        If the image is shown at half its size or less, there's no need to
+        convert every pixel into the pixmap. With nearest neighbor scaling,
+        subsampling the image (such that the pixmap is still larger than the
+        displayed image) yields a similar result but saves a lot of memory
+        bandwidth for large images.
+
+        Unsupported images are never subsampled, because they are replaced
+        by an error pixmap (see `pixmapFromNumpy`).
+        """
+        if (self._img_np.ndim == 3) and \
+                (self._img_np.shape[2] not in _QIMAGE_FORMATS):
+            return 1
+        if (self._img_scale > 0.5) or \
+                (self._canvas.transformationMode() != Qt.FastTransformation):
+            return 1
+        return int(1.0 / self._img_scale)
+
     def paintCanvas(self) -> None:
         if self._img_np is None:
             return
         self._img_scale = max(self._min_img_scale, self._img_scale)
+        stride = self._previewStride()
+        if self._is_pixmap_outdated or (stride != self._canvas.pixmapStride()):
+            pixmap = pixmapFromNumpy(self._img_np[::stride, ::stride])
+            self._canvas.showPixmap(pixmap, stride)
+            self._is_pixmap_outdated = False
+        elif self._img_scale == self._canvas.scale():
+            # Neither the pixmap nor the scale changed.
+            return
+        # Adjusts the canvas size and schedules the repaint.
         self._canvas.setScale(self._img_scale)
-        self._canvas.adjustSize()
-        self._canvas.update()
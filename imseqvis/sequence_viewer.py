@@ -1,10 +1,14 @@
 from qtpy.QtWidgets import QApplication, QWidget, QVBoxLayout, QSizePolicy
 from qtpy.QtCore import Signal, Slot, QPointF
 from pathlib import Path
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import threading
 import numpy as np
 from vito import imutils
 from natsort import natsorted
-from typing import List
+from typing import List, Optional, Union
 
 from .image_viewer import ImageViewer, pixmapFromNumpy
 from .control_widget import SequenceControlWidget
@@ -13,21 +17,110 @@ from .control_widget import SequenceControlWidget
 class ImageSequence(object):
     """
     Provides random access to a list of image files.
+
+    Recently decoded images are kept in a small LRU cache and the next images
+    are decoded in the background, so that playback does not stall on disk
+    access. Cached images are shared and thus returned as read-only arrays.
     """
-    def __init__(self, files: List[Path]):
+    def __init__(
+            self,
+            files: List[Union[Path, str]],
+            cache_size: int = 8,
+            num_prefetch: int = 3,
+            preload: bool = False,
+            num_workers: Optional[int] = None):
         """
         Creates the image sequence.
 
         Args:
           files: List of image files.
+          cache_size: Maximum number of decoded images to keep in memory.
+          num_prefetch: Number of images following the most recently
+            requested one, which will be decoded in background threads.
+            Set to 0 to disable prefetching. Must be less than `cache_size`.
+          preload: If True, all images will be decoded upfront (in parallel)
+            and kept in memory. Only use this for sequences which fit into
+            the available memory.
+          num_workers: Number of threads used to prefetch the images (if
+            None, one thread per prefetched image will be used), or number
+            of processes used to preload the images (if None, the number
+            of available CPUs will be used).
         """
+        if num_prefetch >= cache_size:
+            raise ValueError(
+                f'Number of prefetched images ({num_prefetch}) must be less '
+                f'than the cache size ({cache_size})!')
         self.files = files
+        self.cache_size = cache_size
+        self.num_prefetch = num_prefetch
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._pending = dict()
+        # The decoder releases the GIL, so the upcoming images can be decoded
+        # in parallel, e.g. after jumping to a different frame.
+        self._prefetcher = ThreadPoolExecutor(
+            max_workers=num_prefetch if num_workers is None else num_workers) \
+            if (num_prefetch > 0) and not preload else None
+        self._preloaded = None
+        if preload:
+            with ProcessPoolExecutor(max_workers=num_workers) as pool:
+                self._preloaded = list(
+                    pool.map(imutils.imread, self.files, chunksize=8))
+            for img in self._preloaded:
+                img.setflags(write=False)
     
     def __len__(self) -> int:
         return len(self.files)
 
     def __getitem__(self, index: int) -> np.array:
-        return imutils.imread(self.files[index])
+        if self._preloaded is not None:
+            return self._preloaded[index]
+        with self._cache_lock:
+            img = self._cache.get(index)
+            if img is not None:
+                self._cache.move_to_end(index)
+            future = self._pending.get(index)
+        if img is None:
+            if future is not None:
+                # The image is currently being prefetched.
+                img = future.result()
+            else:
+                img = self._load(index)
+        if self._prefetcher is not None:
+            self._prefetch(index)
+        return img
+
+    def _prefetch(self, index: int) -> None:
+        """Schedules decoding of the images following the given index."""
+        upcoming = range(
+            index + 1, min(len(self), index + 1 + self.num_prefetch))
+        with self._cache_lock:
+            # Drop queued requests which are no longer needed, e.g. because
+            # the user jumped to a different frame.
+            for idx in [i for i in self._pending if i not in upcoming]:
+                if self._pending[idx].cancel():
+                    del self._pending[idx]
+            for idx in upcoming:
+                if (idx not in self._cache) and (idx not in self._pending):
+                    self._pending[idx] = self._prefetcher.submit(
+                        self._load, idx)
+
+    def _load(self, index: int) -> np.array:
+        """Decodes the image at the given index and adds it to the cache."""
+        try:
+            img = imutils.imread(self.files[index])
+            img.setflags(write=False)
+        except BaseException:
+            with self._cache_lock:
+                self._pending.pop(index, None)
+            raise
+        with self._cache_lock:
+            self._cache[index] = img
+            self._cache.move_to_end(index)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            self._pending.pop(index, None)
+        return img
     
     def filename(self, index: int) -> Path:
         return Path(self.files[index])
@@ -40,23 +133,107 @@ class ImageFolder(ImageSequence):
     def __init__(
             self,
             folder: Path,
-            image_extensions: List[str] = ['.png', '.jpg', '.jpeg']):
+            image_extensions: List[str] = ['.png', '.jpg', '.jpeg'],
+            **kwargs):
         """
         Creates the image sequence.
 
         Args:
           folder: Path to the folder containing the images.
-          image_extensions: The file extensions to consider as images.
+          image_extensions: The file extensions to consider as images. The
+            comparison is case-insensitive.
+          kwargs: Additional arguments passed to the ImageSequence, e.g. to
+            configure caching or preloading.
         """
         if not isinstance(folder, Path):
             folder = Path(folder)
         if not folder.is_dir():
             raise ValueError(f'Folder "{folder}" is not a directory!')
 
-        files = natsorted(
-            [f for f in folder.iterdir() if f.is_file()
-             and f.suffix in image_extensions])
-        super().__init__(files)
+        # DirEntry.is_file() can usually be answered without an additional
+        # stat() call, which speeds up listing folders with many files.
+        extensions = frozenset(ext.lower() for ext in image_extensions)
+        with os.scandir(folder) as entries:
+            files = natsorted(
+                [entry.path for entry in entries if entry.is_file()
+                 and os.path.splitext(entry.name)[1].lower() in extensions])
+        super().__init__(files, **kwargs)
+
+
+class RawSequence(object):
+    """
+    Provides random access to uncompressed images which are stored
+    consecutively within a single file, e.g. written via `ndarray.tofile`.
+
+    The file is memory-mapped, thus images are neither decoded nor copied,
+    but returned as read-only views into the file.
+    """
+    def __init__(
+            self,
+            filename: Union[Path, str],
+            shape: tuple,
+            dtype: np.dtype = np.uint8,
+            offset: int = 0):
+        """
+        Creates the image sequence.
+
+        Args:
+          filename: Path to the raw file.
+          shape: Shape of a single image, i.e. (height, width) or
+            (height, width, channels). The number of images is derived from
+            the file size.
+          dtype: Data type of the pixel values.
+          offset: Number of bytes to skip at the beginning of the file, e.g.
+            to skip a header.
+        """
+        self._filename = Path(filename)
+        data = np.memmap(filename, dtype=dtype, mode='r', offset=offset)
+        num_values = int(np.prod(shape))
+        if data.size % num_values != 0:
+            raise ValueError(
+                f'Size of "{filename}" is not a multiple of the image shape '
+                f'{shape}!')
+        self._images = data.reshape((-1,) + tuple(shape))
+
+    @classmethod
+    def fromSequence(
+            cls,
+            image_sequence,
+            filename: Union[Path, str]) -> 'RawSequence':
+        """
+        Decodes all images of the given sequence once and stores them as a
+        raw file, such that subsequent passes over the sequence (or later
+        sessions, by opening the file via the constructor) skip decoding.
+
+        Args:
+          image_sequence: A random access sequence of images, e.g. an
+            ImageFolder. All images must have the same shape and dtype.
+          filename: Path to the raw file, which will be overwritten.
+        """
+        shape = None
+        dtype = None
+        with open(filename, 'wb') as f:
+            for index in range(len(image_sequence)):
+                img = np.ascontiguousarray(image_sequence[index])
+                if shape is None:
+                    shape, dtype = img.shape, img.dtype
+                elif (img.shape != shape) or (img.dtype != dtype):
+                    raise ValueError(
+                        f'Image {index} ({img.shape}, {img.dtype}) differs '
+                        f'from the first image ({shape}, {dtype})!')
+                f.write(img.data)
+        if shape is None:
+            raise ValueError('Cannot create a raw file from an empty sequence!')
+        return cls(filename, shape, dtype)
+
+    def __len__(self) -> int:
+        return self._images.shape[0]
+
+    def __getitem__(self, index: int) -> np.array:
+        return self._images[index]
+
+    def filename(self, index: int) -> Path:
+        return self._filename
 
 
 class SequenceViewer(QWidget):